@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import asyncio
+import time
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.const import CONF_MAC
@@ -11,10 +14,40 @@ from .beurer_daylight_lamps import BeurerInstance, get_device
 
 PLATFORMS = ["light"]
 
+# Seconds a BLEDevice seen during a scan is reused for setting up that MAC
+DEVICE_CACHE_TTL = 60.0
+
+async def _async_get_device(hass: HomeAssistant, mac: str) -> BLEDevice | None:
+    """Return the BLEDevice for mac, reusing recent scan results and scans already running for it."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    cache = domain_data.setdefault("_device_cache", {})
+    scans = domain_data.setdefault("_device_scans", {})
+    key = mac.lower()
+
+    cached = cache.get(key)
+    if cached and time.monotonic() - cached[1] < DEVICE_CACHE_TTL:
+        LOGGER.debug("Using cached device for %s", mac)
+        return cached[0]
+
+    def remember(device: BLEDevice) -> None:
+        # Every device the scan sees is cached, so lamps set up later can skip their own scan.
+        # Expired entries go first, or phones with random addresses would pile up forever.
+        now = time.monotonic()
+        for address in [a for a, (_, seen) in cache.items() if now - seen >= DEVICE_CACHE_TTL]:
+            del cache[address]
+        cache[device.address.lower()] = (device, now)
+
+    # Entries for the same lamp share one scan, scans for different lamps run side by side
+    scan = scans.get(key)
+    if scan is None:
+        scan = scans[key] = hass.async_create_task(get_device(mac, remember))
+        scan.add_done_callback(lambda _: scans.pop(key, None))
+    return await asyncio.shield(scan)
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Beurer daylight lamp from a config entry."""
     LOGGER.debug(f"Setting up device from __init__")
-    device = await get_device(entry.data[CONF_MAC])
+    device = await _async_get_device(hass, entry.data[CONF_MAC])
     if device == None:
         LOGGER.error(f"Was not able to find device with mac {entry.data[CONF_MAC]}")
         return False  # Return False instead of continuing with None device
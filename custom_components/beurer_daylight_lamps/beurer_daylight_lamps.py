@@ -1,6 +1,8 @@
 from typing import Tuple, Callable
-import traceback
+from functools import reduce
+import operator
 import asyncio
+import time
 
 # Try to import bleak, but handle gracefully if not available
 try:
@@ -45,66 +47,119 @@ if not LOGGER.hasHandlers():
 
 WRITE_CHARACTERISTIC_UUIDS = ["8b00ace7-eb0b-49b0-bbe9-9aee0a26e1a3"]
 READ_CHARACTERISTIC_UUIDS  = ["0734594a-a8e7-4b1a-a6b1-cd5243059a57"]
+_WRITE_UUIDS = frozenset(WRITE_CHARACTERISTIC_UUIDS)
+_READ_UUIDS = frozenset(READ_CHARACTERISTIC_UUIDS)
 
-async def discover():
-    devices = await BleakScanner.discover(timeout=15.0)
-    LOGGER.debug("Discovered devices: %s", [{"address": device.address, "name": device.name} for device in devices])
+# Interactive scans: request scan responses (active mode) so the lamp's name arrives with its first advertisement
+SCAN_KWARGS = {"scanning_mode": "active"}
+
+def _make_frame(message: list[int]) -> bytes:
+    """Wrap a command message in the lamp's packet framing (header, length, checksum, trailer)."""
+    length = len(message)
+    checksum = reduce(operator.xor, message, length+2)
+    return bytes([0xFE,0xEF,0x0A,length+7,0xAB,0xAA,length+2,*message,checksum,0x55,0x0D,0x0A])
+
+def _brightness_to_percent(brightness: int) -> int:
+    """Scale a 0-255 brightness to the lamp's 0-100 range, rounded to nearest."""
+    return min(100, (brightness*100 + 127)//255)
 
-    beurer_devices = []
-    for device in devices:
-        if device.name:
-            if device.name.lower().startswith("tl100"):
-                beurer_devices.append(device)
-                LOGGER.debug(f"Found potential Beurer device: {device.address} - {device.name}")
+def _percent_to_brightness(percent: int) -> int:
+    """Scale the lamp's 0-100 brightness back to 0-255, rounded to nearest."""
+    return (percent*255 + 50)//100
 
-    # If no devices found by name, also check devices that provide the specific characteristics we need
+# _percent_to_brightness() for every value the lamp reports, notifications index this directly
+_LUT100 = bytes(_percent_to_brightness(percent) for percent in range(101))
+
+async def discover():
+    devices: dict[str, BLEDevice] = {}
+    beurer_devices: dict[str, BLEDevice] = {}
+    found = asyncio.Event()
+
+    def detection_callback(device: BLEDevice, advertisement_data):
+        # Devices advertise repeatedly, keep a single entry per address
+        devices[device.address] = device
+        name = advertisement_data.local_name or device.name
+        if name and name.lower().startswith("tl100"):
+            if device.address not in beurer_devices:
+                beurer_devices[device.address] = device
+                LOGGER.debug("Found potential Beurer device: %s - %s", device.address, name)
+                found.set()
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + 15.0
+    async with BleakScanner(detection_callback=detection_callback, **SCAN_KWARGS):
+        try:
+            await asyncio.wait_for(found.wait(), timeout=15.0)
+            # Stop early once a lamp shows up, but give other lamps in range a moment to advertise too
+            await asyncio.sleep(min(2.0, max(0.0, deadline - loop.time())))
+        except asyncio.TimeoutError:
+            pass
+    LOGGER.debug("Discovered devices: %s", [{"address": device.address, "name": device.name} for device in devices.values()])
+
+    # Lamps are recognised by name only, connecting to arbitrary nearby devices is slow and can upset them
     if not beurer_devices:
-        LOGGER.debug("No devices found by name pattern, checking for devices with required characteristics...")
-        for device in devices:
-            try:
-                # Try to connect briefly to check characteristics
-                async with BleakClient(device, timeout=10.0) as client:
-                    if client.is_connected:
-                        has_read_char = any(char.uuid in READ_CHARACTERISTIC_UUIDS
-                                          for service in client.services
-                                          for char in service.characteristics)
-                        has_write_char = any(char.uuid in WRITE_CHARACTERISTIC_UUIDS
-                                           for service in client.services
-                                           for char in service.characteristics)
-                        if has_read_char and has_write_char:
-                            beurer_devices.append(device)
-                            LOGGER.debug(f"Found device by characteristics: {device.address} - {device.name}")
-            except Exception as e:
-                LOGGER.debug(f"Could not check characteristics for {device.address}: {e}")
-                continue
-
-    return beurer_devices
-
-async def get_device(mac: str) -> BLEDevice | None:
-    #More robust get_device
+        LOGGER.debug("No devices found by name pattern")
+
+    return list(beurer_devices.values())
+
+async def get_device(mac: str, seen: Callable[[BLEDevice], None] | None = None) -> BLEDevice | None:
+    """Scan for the lamp with the given MAC, passing every advertising device to seen if given."""
+    mac = mac.lower()
+
+    def match(device: BLEDevice, advertisement_data) -> bool:
+        if seen:
+            seen(device)
+        return device.address.lower() == mac
+
     try:
-        device = await BleakScanner.find_device_by_address(mac, timeout=15.0)
+        device = await BleakScanner.find_device_by_filter(match, timeout=15.0, **SCAN_KWARGS)
         if device:
-            LOGGER.debug(f"Found device by MAC via find_device_by_address: {device.address} - {device.name}")
+            LOGGER.debug("Found device by MAC via find_device_by_filter: %s - %s", device.address, device.name)
             return device
     except BleakError as e:
-        LOGGER.debug(f"BleakError with find_device_by_address for {mac}: {e}. Falling back to full scan.")
-    except Exception as e: # Catch other potential errors from find_device_by_address
-        LOGGER.debug(f"Exception with find_device_by_address for {mac}: {e}. Falling back to full scan.")
+        LOGGER.debug("BleakError with find_device_by_filter for %s: %s. Falling back to filtered scan.", mac, e)
+    except Exception as e: # Catch other potential errors from find_device_by_filter
+        LOGGER.debug("Exception with find_device_by_filter for %s: %s. Falling back to filtered scan.", mac, e)
 
 
-    LOGGER.debug(f"Performing full scan to find MAC: {mac}")
-    try:
-        devices = await BleakScanner.discover(timeout=15.0)
-        LOGGER.debug(f"Full scan discovered: {[{'address': d.address, 'name': d.name} for d in devices]}")
-        return next((device for device in devices if device.address.lower()==mac.lower()), None)
+    LOGGER.debug("Performing filtered scan to find MAC: %s", mac)
+    found = asyncio.get_running_loop().create_future()
 
+    def detection_callback(device: BLEDevice, advertisement_data):
+        # Stop at the first advertisement from the requested lamp instead of waiting out the scan
+        if match(device, advertisement_data) and not found.done():
+            found.set_result(device)
+
+    try:
+        async with BleakScanner(detection_callback=detection_callback, **SCAN_KWARGS):
+            return await asyncio.wait_for(found, timeout=10.0)
+    except asyncio.TimeoutError:
+        LOGGER.debug("No advertisement seen from %s during scan", mac)
+        return None
     except Exception as e:
-        LOGGER.error(f"Error during device discovery for {mac}: {e}")
-        LOGGER.error(f"This might indicate a Bluetooth or bleak installation problem")
+        LOGGER.error("Error during device discovery for %s: %s", mac, e)
+        LOGGER.error("This might indicate a Bluetooth or bleak installation problem")
         return None
 
 class BeurerInstance:
+    SUPPORTED_EFFECTS = ("Off", "Random", "Rainbow", "Rainbow Slow", "Fusion", "Pulse", "Wave", "Chill", "Action", "Forest", "Summer")
+
+    # Frames for commands without parameters, built once instead of on every send
+    _FRAME_STATUS_WHITE = _make_frame([0x30, 0x01])
+    _FRAME_STATUS_COLOR = _make_frame([0x30, 0x02])
+    _STATUS_FRAMES = (_FRAME_STATUS_WHITE, _FRAME_STATUS_COLOR)
+    _FRAME_MODE_WHITE = _make_frame([0x37, 0x01])
+    _FRAME_MODE_RGB = _make_frame([0x37, 0x02])
+    _FRAME_TURN_OFF = _make_frame([0x35, 0x01]) + _make_frame([0x35, 0x02])
+    # Effect name -> position, and the framed 0x34 packet per position, shared by all instances
+    _effect_index = {name: position for position, name in enumerate(SUPPORTED_EFFECTS)}
+    _effect_frames = tuple(_make_frame([0x34, position]) for position in range(len(SUPPORTED_EFFECTS)))
+
+    # Frames queued within this window (seconds) are sent together in one GATT write
+    _COALESCE_WINDOW = 0.02
+    _COALESCE_MAX_FRAMES = 8
+    _WRITE_ATTEMPTS = 3
+
     def __init__(self, device: BLEDevice) -> None:
         if device is None:
             LOGGER.error("BeurerInstance initialized with None device object.")
@@ -112,7 +167,7 @@ class BeurerInstance:
 
         # Additional safety check
         if not hasattr(device, 'address'):
-            LOGGER.error(f"Device object has no 'address' attribute. Device type: {type(device)}, Device: {device}")
+            LOGGER.error("Device object has no 'address' attribute. Device type: %s, Device: %s", type(device), device)
             raise ValueError(f"Invalid device object: {device}")
 
         self._mac = device.address
@@ -121,7 +176,7 @@ class BeurerInstance:
         try:
             self._device = BleakClient(device, disconnected_callback=self.disconnected_callback)
         except Exception as e:
-            LOGGER.error(f"Failed to create BleakClient: {e}")
+            LOGGER.error("Failed to create BleakClient: %s", e)
             raise
 
         self._trigger_update = None
@@ -132,52 +187,94 @@ class BeurerInstance:
         self._brightness = None
         self._color_brightness = None
         self._effect = "Off" # Initialize to "Off"
-        self._write_uuid = None
-        self._read_uuid = None
+        self._write_char: BleakGATTCharacteristic | None = None
+        self._read_char: BleakGATTCharacteristic | None = None
+        self._write_needs_response = True
+        self._write_response_supported = True
+        # Largest ATT payload (MTU - 3) of the current connection, the BLE default until connected
+        self._write_payload = 20
+        # Mirrors is_connected for the command paths, set once connected and cleared on any disconnect
+        self._connected_flag = False
         self._mode = COLOR_MODE_WHITE # Default to a mode, e.g., white
-        self._supported_effects = ["Off", "Random", "Rainbow", "Rainbow Slow", "Fusion", "Pulse", "Wave", "Chill", "Action", "Forest", "Summer"]
+        self._write_lock = asyncio.Lock() # One outstanding GATT write at a time
+        self._connect_lock = asyncio.Lock()
+        self._connecting_task: asyncio.Task | None = None
+        self._pending: list[bytes] = []
+        self._pending_size = 0
+        self._flush_done: asyncio.Future | None = None
+        self._flush_task: asyncio.Task | None = None
+        self._flush_now = asyncio.Event()
+        self._status_dirty = False
+        self._status_versions: set[int] = set()
+        self._status_task: asyncio.Task | None = None
+        self._notification_queue: asyncio.Queue = asyncio.Queue()
+        self._notification_task: asyncio.Task | None = None
+        # One event per status reply version (1 white, 2 color, 255 off), set when such a notification was processed
+        self._ack_events = {version: asyncio.Event() for version in (1, 2, 255)}
+        # Monotonic times of the last reply and of the last status request per version, and of the last command queued
+        self._reply_times = {version: 0.0 for version in (1, 2, 255)}
+        self._status_sent = {version: 0.0 for version in (1, 2)}
+        self._last_command_time = 0.0
+        self._reply_handlers = {1: self._handle_white_status, 2: self._handle_color_status, 255: self._handle_off}
 
         # Defer connection to an explicit call rather than __init__ for more control
         # asyncio.create_task(self.connect())
 
     def disconnected_callback(self, client):
-        LOGGER.debug(f"Disconnected callback called for {self._mac}")
+        LOGGER.debug("Disconnected callback called for %s", self._mac)
+        self._connected_flag = False
         self._is_on = False
         self._light_on = False
         self._color_on = False
-        self._write_uuid = None
-        self._read_uuid = None
-        if self._trigger_update: # Check if callback is set
-            asyncio.create_task(self.trigger_entity_update())
+        self._write_char = None
+        self._read_char = None
+        # The HA callback is synchronous, call it directly rather than wrapping it in a task
+        self.trigger_entity_update()
+
+    def invalidate(self, *channels: str):
+        """Mark the given channels ("light_on", "color_on") as off until a status reply says otherwise."""
+        for channel in channels:
+            setattr(self, "_" + channel, False)
 
     def set_update_callback(self, trigger_update: Callable):
-        LOGGER.debug(f"Setting update callback to {trigger_update}")
+        LOGGER.debug("Setting update callback to %s", trigger_update)
         self._trigger_update = trigger_update
 
     async def _write(self, data: bytearray):
-        if not self._device or not self._device.is_connected:
-            LOGGER.warning(f"_write called but device not connected or not initialized. Attempting connect for {self._mac}.")
-            if not await self.connect(): # connect() should handle self._device being None
-                LOGGER.error(f"Failed to connect in _write for {self._mac}. Cannot write.")
-                return
-        
-        if not self._write_uuid:
-            LOGGER.error(f"Write UUID not set for {self._mac}. Cannot write. Please ensure connection and characteristic discovery succeeded.")
+        # _write_frame() already connected before queueing, if the link dropped since then this batch is lost
+        if not self._connected_flag:
+            LOGGER.warning("_write called but device %s is no longer connected. Dropping write.", self._mac)
             return
 
-        LOGGER.debug("Sending in write: " + ''.join(format(x, '02x') for x in data)+f" to characteristic {self._write_uuid}")
-        try:
-            await self._device.write_gatt_char(self._write_uuid, data)
-        except BleakError as error:
-            track = traceback.format_exc()
-            LOGGER.debug(f"BleakError track for write: {track}")
-            LOGGER.warning(f"BleakError while trying to write to device {self._mac}: {error}")
-            await self.disconnect() # Disconnect on write error
-        except Exception as e:
-            track = traceback.format_exc()
-            LOGGER.debug(f"Exception track for write: {track}")
-            LOGGER.error(f"Unexpected error during write to {self._mac}: {e}")
-            await self.disconnect()
+        if not self._write_char:
+            LOGGER.error("Write characteristic not set for %s. Cannot write. Please ensure connection and characteristic discovery succeeded.", self._mac)
+            return
+
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug("Sending in write: %s to characteristic %s", data.hex(), self._write_char.uuid)
+        # Write without response cannot be split, so bursts larger than one ATT payload still need a response
+        response = self._write_needs_response or (len(data) > self._write_payload and self._write_response_supported)
+        # The lock also covers the backoff, so a later flush cannot overtake a batch that is being retried
+        async with self._write_lock:
+            for attempt in range(self._WRITE_ATTEMPTS):
+                try:
+                    await self._device.write_gatt_char(self._write_char, data, response=response)
+                    return
+                except BleakError as error:
+                    # A busy controller is transient, back off briefly instead of dropping the connection
+                    reason = str(error).lower()
+                    if attempt + 1 < self._WRITE_ATTEMPTS and ("in progress" in reason or "busy" in reason):
+                        LOGGER.debug("Write to %s rejected as busy (%s), retrying", self._mac, error)
+                        await asyncio.sleep(0.05 * (1 << attempt))
+                        continue
+                    # Traceback only at debug level, and formatted lazily by the handler
+                    LOGGER.warning("BleakError while trying to write to device %s: %s", self._mac, error, exc_info=LOGGER.isEnabledFor(logging.DEBUG))
+                    await self.disconnect() # Disconnect on write error
+                    return
+                except Exception as e:
+                    LOGGER.error("Unexpected error during write to %s: %s", self._mac, e, exc_info=LOGGER.isEnabledFor(logging.DEBUG))
+                    await self.disconnect()
+                    return
 
 
     @property
@@ -185,6 +282,8 @@ class BeurerInstance:
     @property
     def is_on(self): return self._is_on
     @property
+    def connected(self): return self._connected_flag
+    @property
     def rgb_color(self): return self._rgb_color
     @property
     def color_brightness(self): return self._color_brightness
@@ -195,7 +294,7 @@ class BeurerInstance:
     @property
     def color_mode(self): return self._mode
     @property
-    def supported_effects(self): return self._supported_effects
+    def supported_effects(self): return self.SUPPORTED_EFFECTS
 
     def find_effect_position(self, effect: str | None) -> int:
         if effect is None:
@@ -203,80 +302,81 @@ class BeurerInstance:
             effect_to_find = "Off"
         else:
             effect_to_find = effect
-        try:
-            return self._supported_effects.index(effect_to_find)
-        except ValueError:
-            LOGGER.warning(f"Effect '{effect_to_find}' not found in supported_effects. Defaulting to 'Off' (index 0).")
+        position = self._effect_index.get(effect_to_find)
+        if position is None:
+            LOGGER.warning("Effect '%s' not found in supported_effects. Defaulting to 'Off' (index 0).", effect_to_find)
             return 0
+        return position
 
-    def makeChecksum(self, b: int, bArr: list[int]) -> int:
-        for b2 in bArr:
-            b = b ^ b2
-        return b
-
-    async def sendPacket(self, message: list[int]):
-        if not self._device or not self._device.is_connected: # Check self._device too
-            LOGGER.warning(f"sendPacket: Device not connected for {self._mac}. Attempting connect.")
+    async def _write_frame(self, frame: bytes):
+        if not self._connected_flag:
+            LOGGER.warning("sendPacket: Device not connected for %s. Attempting connect.", self._mac)
             if not await self.connect():
-                LOGGER.error(f"sendPacket: Failed to connect for {self._mac}. Cannot send.")
+                LOGGER.error("sendPacket: Failed to connect for %s. Cannot send.", self._mac)
                 return
 
-        length=len(message)
-        checksum = self.makeChecksum(length+2,message)
-        packet_data=bytearray([0xFE,0xEF,0x0A,length+7,0xAB,0xAA,length+2]+message+[checksum,0x55,0x0D,0x0A])
-        # Using print for HA logs is not ideal, prefer LOGGER.debug
-        LOGGER.debug("Sending message (packet): "+''.join(format(x, '02x') for x in packet_data))
-        await self._write(packet_data)
-
-    async def set_color(self, rgb: Tuple[int, int, int], _from_turn_on: bool = False):
-        r, g, b = rgb
-        LOGGER.debug(f"Setting to color: R={r}, G={g}, B={b} for {self._mac}")
-        self._mode = COLOR_MODE_RGB
-        self._rgb_color = (r,g,b)
+        if frame not in self._STATUS_FRAMES:
+            self._last_command_time = time.monotonic()
+        self._pending.append(frame)
+        self._pending_size += len(frame)
+        if self._flush_done is None:
+            self._flush_done = asyncio.get_running_loop().create_future()
+            self._flush_task = asyncio.create_task(self._flush_soon())
+        if len(self._pending) >= self._COALESCE_MAX_FRAMES or self._pending_size >= self._write_payload:
+            self._flush_now.set()
+        await asyncio.shield(self._flush_done)
+
+    async def _flush_soon(self):
+        """Wait for the coalescing window (or a full batch), then write all queued frames at once."""
+        done = self._flush_done
+        try:
+            try:
+                await asyncio.wait_for(self._flush_now.wait(), self._COALESCE_WINDOW)
+            except asyncio.TimeoutError:
+                pass
+            data = b"".join(self._pending)
+            self._pending = []
+            self._pending_size = 0
+            self._flush_done = None
+            self._flush_now.clear()
+            if LOGGER.isEnabledFor(logging.DEBUG):
+                LOGGER.debug("Sending message (packet): %s", data.hex())
+            await self._write(data)
+        finally:
+            if self._flush_task is asyncio.current_task():
+                self._flush_task = None
+            if not done.done():
+                done.set_result(None)
+
+    async def _write_frame_acked(self, frame: bytes, reply_version: int, timeout: float):
+        """Send frame, then wait at most timeout seconds for the lamp's next status notification of reply_version."""
+        self._ack_events[reply_version].clear()
+        await self._write_frame(frame)
+        await self._wait_for_ack(reply_version, timeout)
+
+    async def _wait_for_ack(self, reply_version: int, timeout: float):
+        try:
+            await asyncio.wait_for(self._ack_events[reply_version].wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
 
-        # SIMPLIFIED: Always ensure we're in RGB mode first, like in set_white
-        if not self._color_on:
-            LOGGER.debug(f"Activating RGB mode for {self._mac}")
-            await self.sendPacket([0x37, 0x02])  # Activate RGB mode
-            await asyncio.sleep(0.3)
-            self._color_on = True
-            self._light_on = False
-            self._is_on = True
-            # Set effect to "Off" immediately to prevent unwanted effects
-            self._effect = "Off"
-            await self.sendPacket([0x34, 0])  # Set effect to "Off" (position 0)
-            await asyncio.sleep(0.3)
-
-        await self.sendPacket([0x32,r,g,b])
-        await asyncio.sleep(0.3) # Delay for stability
-        await self.triggerStatus()
-        await asyncio.sleep(0.2) # Additional delay after status request
-
-    async def set_color_brightness(self, brightness: int | None, _from_turn_on: bool = False):
-        LOGGER.debug(f"set_color_brightness called with: {brightness} for {self._mac}")
-        actual_brightness_to_set = brightness
-        if actual_brightness_to_set is None:
-            LOGGER.warning(f"set_color_brightness for {self._mac} received None, defaulting to 255 (100%).")
-            actual_brightness_to_set = 255
-        
-        self._mode = COLOR_MODE_RGB
-        self._color_brightness = actual_brightness_to_set
+    async def sendPacket(self, message: list[int]):
+        await self._write_frame(_make_frame(message))
 
-        if not _from_turn_on and (not self._is_on or not self._color_on):
-            await self.turn_on()
-            return # Don't send packet again, turn_on will handle it
+    async def set_color(self, rgb: Tuple[int, int, int]):
+        await self.set_color_brightness_effect(rgb=rgb)
 
-        brightness_0_100 = max(0, min(100, int(actual_brightness_to_set / 255 * 100)))
-        await self.sendPacket([0x31,0x02, brightness_0_100])
-        await asyncio.sleep(0.5) # Increased delay for stability
-        await self.triggerStatus()
-        await asyncio.sleep(0.3) # Additional delay after status request
+    async def set_color_brightness(self, brightness: int | None):
+        if brightness is None:
+            LOGGER.warning("set_color_brightness for %s received None, defaulting to 255 (100%%).", self._mac)
+            brightness = 255
+        await self.set_color_brightness_effect(brightness=brightness)
 
-    async def set_white(self, intensity: int | None, _from_turn_on: bool = False):
-        LOGGER.debug(f"Setting white to intensity: {intensity} for {self._mac}")
+    async def set_white(self, intensity: int | None):
+        LOGGER.debug("Setting white to intensity: %s for %s", intensity, self._mac)
         actual_intensity_to_set = intensity
         if actual_intensity_to_set is None:
-            LOGGER.warning(f"set_white for {self._mac} received None, defaulting to 255 (100%).")
+            LOGGER.warning("set_white for %s received None, defaulting to 255 (100%%).", self._mac)
             actual_intensity_to_set = 255
 
         self._mode = COLOR_MODE_WHITE
@@ -284,299 +384,386 @@ class BeurerInstance:
 
         # SIMPLIFIED: Always ensure we're in the right mode by activating white mode first
         if not self._light_on:
-            LOGGER.debug(f"Activating white mode for {self._mac}")
-            await self.sendPacket([0x37, 0x01])  # Activate white mode
-            await asyncio.sleep(0.3)
+            LOGGER.debug("Activating white mode for %s", self._mac)
+            await self._write_frame_acked(self._FRAME_MODE_WHITE, 1, 0.3)  # Activate white mode
             self._light_on = True
             self._color_on = False
             self._is_on = True
 
-        intensity_0_100 = max(0, min(100, int(actual_intensity_to_set / 255 * 100)))
+        intensity_0_100 = _brightness_to_percent(actual_intensity_to_set)
         await self.sendPacket([0x31,0x01, intensity_0_100])
-        await asyncio.sleep(0.3) # Delay for stability
-        await self.triggerStatus() # Status call
-        await asyncio.sleep(0.2) # Additional delay after status
-
-    async def set_effect(self, effect: str | None, _from_turn_on: bool = False):
-        actual_effect = effect
-        if actual_effect is None:
-            LOGGER.debug(f"set_effect for {self._mac} received None, defaulting to 'Off'.")
-            actual_effect = "Off"
-        
-        LOGGER.debug(f"Setting effect to '{actual_effect}' for {self._mac}")
-        self._mode = COLOR_MODE_RGB # Effects are for color mode
-        self._effect = actual_effect # Store the effect we are setting
+        self._schedule_status(1)
 
-        if not _from_turn_on and (not self._is_on or not self._color_on):
-            await self.turn_on()
-            return # Don't send packet again, turn_on will handle it
+    async def set_effect(self, effect: str | None):
+        await self.set_color_brightness_effect(effect=effect if effect is not None else "Off")
+
+    async def set_color_brightness_effect(self, rgb: Tuple[int, int, int] | None = None, brightness: int | None = None, effect: str | None = None):
+        """Apply any of color, color brightness and effect with a single write."""
+        LOGGER.debug("Setting color=%s, color brightness=%s, effect=%s for %s", rgb, brightness, effect, self._mac)
+        self._mode = COLOR_MODE_RGB
 
-        await self.sendPacket([0x34, self.find_effect_position(actual_effect)])
-        await asyncio.sleep(0.5) # Increased delay for stability
-        await self.triggerStatus()
-        await asyncio.sleep(0.3) # Additional delay after status request
+        if not self._color_on:
+            LOGGER.debug("Activating RGB mode for %s", self._mac)
+            await self._write_frame_acked(self._FRAME_MODE_RGB, 2, 0.3)
+            self._color_on = True
+            self._light_on = False
+            self._is_on = True
+            # Don't let a previous effect come back with the mode switch
+            if effect is None:
+                effect = "Off"
+
+        # Same order as the restore burst in turn_on: effect, color, brightness
+        frame = b""
+        if effect is not None:
+            self._effect = effect
+            frame += self._effect_frames[self.find_effect_position(effect)]
+        if rgb is not None:
+            self._rgb_color = tuple(rgb)
+            frame += _make_frame([0x32, *rgb])
+        if brightness is not None:
+            self._color_brightness = brightness
+            frame += _make_frame([0x31, 0x02, _brightness_to_percent(brightness)])
+
+        if frame:
+            await self._write_frame(frame)
+        self._schedule_status(2)
 
     async def turn_on(self):
-        LOGGER.debug(f"Turning ON for {self._mac}. Current mode: {self._mode}, is_on: {self._is_on}, light_on: {self._light_on}, color_on: {self._color_on}")
+        LOGGER.debug("Turning ON for %s. Current mode: %s, is_on: %s, light_on: %s, color_on: %s", self._mac, self._mode, self._is_on, self._light_on, self._color_on)
 
         # Check if device is properly initialized
         if not self._device:
-            LOGGER.error(f"Cannot turn on {self._mac}: Device not properly initialized.")
+            LOGGER.error("Cannot turn on %s: Device not properly initialized.", self._mac)
             return
 
-        if not self._device.is_connected:
-            LOGGER.debug(f"Device {self._mac} not connected, attempting to connect for turn_on")
+        if not self._connected_flag:
+            LOGGER.debug("Device %s not connected, attempting to connect for turn_on", self._mac)
             if not await self.connect():
-                LOGGER.error(f"Failed to connect in turn_on for {self._mac}. Cannot turn on.")
+                LOGGER.error("Failed to connect in turn_on for %s. Cannot turn on.", self._mac)
                 return
 
         if self._mode == COLOR_MODE_WHITE:
-            await self.sendPacket([0x37,0x01])
-            await asyncio.sleep(0.5) # Added delay after mode switch
+            await self._write_frame(self._FRAME_MODE_WHITE)
             self._light_on = True
             self._color_on = False # Explicitly set other mode off
         else: # COLOR_MODE_RGB or default
             self._mode = COLOR_MODE_RGB # Ensure mode is RGB if not white
-            await self.sendPacket([0x37,0x02])
-            await asyncio.sleep(0.5) # Added delay after mode switch
-            self._color_on = True
-            self._light_on = False # Explicitly set other mode off
-            
+            frame = self._FRAME_MODE_RGB
+
             # Only restore state if it was truly off before this call, to avoid command loops
             if not self._is_on: # Check overall _is_on state before it's set to True
-                LOGGER.debug(f"Restoring last known color state for {self._mac} as it was previously off.")
-                await asyncio.sleep(0.5) # Increased delay for mode switch
+                LOGGER.debug("Restoring last known color state for %s as it was previously off.", self._mac)
 
-                effect_to_restore = self._effect if self._effect is not None else "Off"
-                LOGGER.debug(f"Restoring effect: {effect_to_restore}")
-                await self.set_effect(effect_to_restore, _from_turn_on=True) # Pass flag to prevent recursion
-                await asyncio.sleep(0.5) # Increased delay between operations
+                self._effect = self._effect if self._effect is not None else "Off"
+                self._rgb_color = self._rgb_color if self._rgb_color != (0,0,0) else (255,255,255) # Default to white if (0,0,0)
+                self._color_brightness = self._color_brightness if self._color_brightness is not None else 255
+                LOGGER.debug("Restoring effect: %s, color: %s, color brightness: %s", self._effect, self._rgb_color, self._color_brightness)
 
-                rgb_to_restore = self._rgb_color if self._rgb_color != (0,0,0) else (255,255,255) # Default to white if (0,0,0)
-                LOGGER.debug(f"Restoring color: {rgb_to_restore}")
-                await self.set_color(rgb_to_restore, _from_turn_on=True) # Pass flag to prevent recursion
-                await asyncio.sleep(0.5) # Increased delay between operations
+                brightness_0_100 = _brightness_to_percent(self._color_brightness)
+                frame += self._effect_frames[self.find_effect_position(self._effect)]
+                frame += _make_frame([0x32, *self._rgb_color])
+                frame += _make_frame([0x31, 0x02, brightness_0_100])
 
-                brightness_to_restore = self._color_brightness
-                LOGGER.debug(f"Restoring color brightness: {brightness_to_restore}")
-                await self.set_color_brightness(brightness_to_restore, _from_turn_on=True) # Pass flag to prevent recursion
+            # Mode switch and state restore go out as one burst instead of one round-trip per command
+            await self._write_frame(frame)
+            self._color_on = True
+            self._light_on = False # Explicitly set other mode off
 
         self._is_on = True # Set overall on state
-        await asyncio.sleep(0.5) # Increased delay before final status check
-        await self.triggerStatus()
+        self._schedule_status(1 if self._light_on else 2)
 
     async def turn_off(self):
-        LOGGER.debug(f"Turning OFF for {self._mac}")
-        await self.sendPacket([0x35,0x01])
-        await asyncio.sleep(0.1)
-        await self.sendPacket([0x35,0x02])
+        LOGGER.debug("Turning OFF for %s", self._mac)
+        await self._write_frame(self._FRAME_TURN_OFF)
         self._is_on = False
         self._light_on = False
         self._color_on = False
-        await asyncio.sleep(0.15)
-        await self.triggerStatus()
+        self._schedule_status(1, 2)
 
     async def triggerStatus(self):
-        LOGGER.debug(f"Requesting status update from device {self._mac}")
-        await self.sendPacket([0x30,0x01])
-        await asyncio.sleep(0.2)
-        await self.sendPacket([0x30,0x02])
-        LOGGER.info(f"Status update request sent for {self._mac}")
+        LOGGER.debug("Requesting status update from device %s", self._mac)
+        await self._request_white_status()
+        await self._request_color_status()
+        LOGGER.info("Status update request sent for %s", self._mac)
+
+    def _reply_is_fresh(self, reply_version: int) -> bool:
+        # Fresh means: less than 200 ms old and answering a status request sent after the last command
+        sent = self._status_sent[reply_version]
+        received = self._reply_times[reply_version]
+        return self._last_command_time < sent < received and time.monotonic() - received < 0.2
+
+    async def _request_white_status(self):
+        if self._reply_is_fresh(1):
+            LOGGER.debug("Skipping white status request for %s, recent reply", self._mac)
+            return
+        self._status_sent[1] = time.monotonic()
+        await self._write_frame_acked(self._FRAME_STATUS_WHITE, 1, 0.2)
 
-    async def trigger_entity_update(self):
+    async def _request_color_status(self):
+        if self._reply_is_fresh(2):
+            LOGGER.debug("Skipping color status request for %s, recent reply", self._mac)
+            return
+        self._status_sent[2] = time.monotonic()
+        self._ack_events[2].clear()
+        await self._write_frame(self._FRAME_STATUS_COLOR)
+
+    def _schedule_status(self, *reply_versions: int):
+        """Request the given status replies once the current burst of commands has settled."""
+        self._status_versions.update(reply_versions)
+        self._status_dirty = True
+        if self._status_task is None:
+            self._status_task = asyncio.create_task(self._status_after(0.2))
+
+    async def _status_after(self, delay: float):
+        # Keep pushing the refresh back while new commands arrive, only the final state matters
+        try:
+            while self._status_dirty:
+                self._status_dirty = False
+                await asyncio.sleep(delay)
+                if not self._status_dirty:
+                    versions, self._status_versions = self._status_versions, set()
+                    if 1 in versions:
+                        await self._request_white_status()
+                    if 2 in versions:
+                        await self._request_color_status()
+        finally:
+            self._status_task = None
+
+    def trigger_entity_update(self):
         if self._trigger_update:
-            LOGGER.debug(f"Triggering Home Assistant entity update for {self._mac}")
+            LOGGER.debug("Triggering Home Assistant entity update for %s", self._mac)
             self._trigger_update()
         else:
-            LOGGER.debug(f"No Home Assistant entity update callback set for {self._mac}")
+            LOGGER.debug("No Home Assistant entity update callback set for %s", self._mac)
+
+    def _on_notification(self, characteristic: BleakGATTCharacteristic, data: bytearray):
+        # Only enqueue here, so a slow handler can never delay or reorder the next notification
+        self._notification_queue.put_nowait((characteristic, bytes(data)))
+
+    async def _drain_notifications(self):
+        while True:
+            characteristic, data = await self._notification_queue.get()
+            try:
+                await self.notification_handler(characteristic, data)
+            except Exception as error:
+                LOGGER.error("Error handling notification for %s: %s", self._mac, error, exc_info=LOGGER.isEnabledFor(logging.DEBUG))
 
     async def notification_handler(self, characteristic: BleakGATTCharacteristic, res: bytearray):
-        LOGGER.debug(f"Notification for {self._mac} from {characteristic.uuid}: {''.join(format(x, '02x') for x in res)}")
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug("Notification for %s from %s: %s", self._mac, characteristic.uuid, bytes(res).hex())
         if len(res) < 9:
-            LOGGER.warning(f"Received short notification for {self._mac}: {len(res)} bytes. Ignoring.")
+            LOGGER.warning("Received short notification for %s: %s bytes. Ignoring.", self._mac, len(res))
             return
         
         reply_version = res[8]
-        LOGGER.debug(f"Reply version for {self._mac} is {reply_version}")
-        
-        trigger_ha_update = False
-
-        if reply_version == 1:
-            new_light_on = res[9] == 1
-            new_brightness = None
-            if new_light_on:
-                new_brightness = int(res[10]*255/100) if res[10] > 0 else 0 # Default to 0 if res[10] is 0
-            
-            if self._light_on != new_light_on or self._brightness != new_brightness:
-                trigger_ha_update = True
-            self._light_on = new_light_on
-            self._brightness = new_brightness
-            if self._light_on: self._mode = COLOR_MODE_WHITE # Update mode if white lamp is on
-            LOGGER.debug(f"Status v1 (White) for {self._mac}: On={self._light_on}, Brightness={self._brightness}, Mode={self._mode}")
-
-        elif reply_version == 2:
-            new_color_on = res[9] == 1
-            new_effect = self._effect # Keep current if not updated
-            new_color_brightness = None
-            new_rgb_color = self._rgb_color # Keep current if not updated
-
-            if new_color_on:
-                new_effect = self._supported_effects[res[16]] if res[16] < len(self._supported_effects) else "Off"
-                new_color_brightness = int(res[10]*255/100) if res[10] > 0 else 0 # Default to 0
-                new_rgb_color = (res[13], res[14], res[15])
-            
-            if (self._color_on != new_color_on or 
-                self._effect != new_effect or 
-                self._color_brightness != new_color_brightness or 
-                self._rgb_color != new_rgb_color):
-                trigger_ha_update = True
-
-            self._color_on = new_color_on
-            self._effect = new_effect
-            self._color_brightness = new_color_brightness
-            self._rgb_color = new_rgb_color
-            if self._color_on: self._mode = COLOR_MODE_RGB # Update mode if color lamp is on
-            LOGGER.debug(f"Status v2 (Color) for {self._mac}: On={self._color_on}, Brightness={self._color_brightness}, RGB={self._rgb_color}, Effect='{self._effect}', Mode={self._mode}")
-        
-        elif reply_version == 255:
-            if self._is_on or self._light_on or self._color_on: trigger_ha_update = True
-            self._is_on = False
-            self._light_on = False
-            self._color_on = False
-            LOGGER.debug(f"Device Off notification for {self._mac}")
-
-        elif reply_version == 0:
-            LOGGER.debug(f"Device {self._mac} is going to shut down")
-            await self.disconnect()
-            return
-        else:
-            LOGGER.debug(f"Received unknown notification version for {self._mac}: {reply_version}")
+        LOGGER.debug("Reply version for %s is %s", self._mac, reply_version)
+
+        handler = self._reply_handlers.get(reply_version)
+        if handler is None:
+            if reply_version == 0:
+                LOGGER.debug("Device %s is going to shut down", self._mac)
+                await self.disconnect()
+            else:
+                LOGGER.debug("Received unknown notification version for %s: %s", self._mac, reply_version)
             return
+        trigger_ha_update = handler(res)
 
         new_is_on = self._light_on or self._color_on
         if self._is_on != new_is_on:
             trigger_ha_update = True
         self._is_on = new_is_on
-        
+        self._reply_times[reply_version] = time.monotonic()
+        self._ack_events[reply_version].set()
+
         if trigger_ha_update:
-            await self.trigger_entity_update()
+            self.trigger_entity_update()
+
+    def _handle_white_status(self, res: bytes) -> bool:
+        new_light_on = res[9] == 1
+        new_brightness = _LUT100[min(res[10], 100)] if new_light_on else None
+
+        new_state = (new_light_on, new_brightness)
+        changed = (self._light_on, self._brightness) != new_state
+        self._light_on, self._brightness = new_state
+        if self._light_on: self._mode = COLOR_MODE_WHITE # Update mode if white lamp is on
+        LOGGER.debug("Status v1 (White) for %s: On=%s, Brightness=%s, Mode=%s", self._mac, self._light_on, self._brightness, self._mode)
+        return changed
+
+    def _handle_color_status(self, res: bytes) -> bool:
+        new_color_on = res[9] == 1
+        new_effect = self._effect # Keep current if not updated
+        new_color_brightness = None
+        new_rgb_color = self._rgb_color # Keep current if not updated
+
+        if new_color_on:
+            new_effect = self.SUPPORTED_EFFECTS[res[16]] if res[16] < len(self.SUPPORTED_EFFECTS) else "Off"
+            new_color_brightness = _LUT100[min(res[10], 100)]
+            new_rgb_color = (res[13], res[14], res[15])
+
+        # Compare the whole decoded state in one go rather than field by field
+        new_state = (new_color_on, new_effect, new_color_brightness, new_rgb_color)
+        changed = (self._color_on, self._effect, self._color_brightness, self._rgb_color) != new_state
+        self._color_on, self._effect, self._color_brightness, self._rgb_color = new_state
+        if self._color_on: self._mode = COLOR_MODE_RGB # Update mode if color lamp is on
+        LOGGER.debug("Status v2 (Color) for %s: On=%s, Brightness=%s, RGB=%s, Effect='%s', Mode=%s", self._mac, self._color_on, self._color_brightness, self._rgb_color, self._effect, self._mode)
+        return changed
+
+    def _handle_off(self, res: bytes) -> bool:
+        changed = self._is_on or self._light_on or self._color_on
+        self._is_on = False
+        self._light_on = False
+        self._color_on = False
+        LOGGER.debug("Device Off notification for %s", self._mac)
+        return changed
 
     async def connect(self) -> bool:
-        try:
-            if not self._device: # self._device would be None if __init__ received a None device
-                LOGGER.error(f"Cannot connect: BeurerInstance for {self._mac} was not properly initialized with a device object.")
-                return False
-
-            try:
-                is_connected = self._device.is_connected
-            except Exception as e:
-                LOGGER.error(f"Error checking connection status: {e}")
-                return False
-
+        # Callers that find the link down at the same time share a single connection attempt
+        if self._connecting_task is asyncio.current_task():
+            # A write issued by connect() itself found the link down again, waiting on the lock would deadlock
+            return False
+        async with self._connect_lock:
+            if self._device and self._device.is_connected and self._read_char:
+                return True
+            self._connecting_task = asyncio.current_task()
             try:
-                if not self._device.is_connected:
-                    # Check if device_ble_object is valid
-                    if not self._device_ble_object:
-                        LOGGER.error(f"self._device_ble_object is None!")
-                        return False
-
-                    if not hasattr(self._device_ble_object, 'address'):
-                        LOGGER.error(f"self._device_ble_object has no address attribute: {self._device_ble_object}")
-                        return False
-
-                    # Ensure we use the original BLEDevice object if reconnecting client
-                    # This assumes self._device_ble_object was stored in __init__
-                    try:
-                        device_address = self._device.address if hasattr(self._device, '_backend') and self._device._backend else None
-                    except:
-                        device_address = None
+                return await self._connect()
+            finally:
+                self._connecting_task = None
 
-                    if not isinstance(self._device, BleakClient) or device_address != self._device_ble_object.address:
-                        self._device = BleakClient(self._device_ble_object, disconnected_callback=self.disconnected_callback)
+    async def _connect(self) -> bool:
+        if not self._device: # self._device would be None if __init__ received a None device
+            LOGGER.error("Cannot connect: BeurerInstance for %s was not properly initialized with a device object.", self._mac)
+            return False
 
+        try:
+            if not self._device.is_connected:
+                # Reconnect with the BLEDevice stored in __init__
+                if not isinstance(self._device, BleakClient):
+                    self._device = BleakClient(self._device_ble_object, disconnected_callback=self.disconnected_callback)
+
+                try:
+                    # Reuse the GATT database from the previous connection instead of a full discovery (BlueZ)
+                    await self._device.connect(timeout=20.0, dangerous_use_bleak_cache=True)
+                except TypeError:
+                    # Backend does not accept the cache flag
                     await self._device.connect(timeout=20.0)
-                    LOGGER.info(f"Successfully connected to {self._mac}")
-                    await asyncio.sleep(0.1)
-
-                    self._write_uuid = None
-                    self._read_uuid = None
-                    for service in self._device.services: # Use self._device (BleakClient)
-                        for char_obj in service.characteristics: # Iterate over BleakGATTCharacteristic objects
-                            if char_obj.uuid in WRITE_CHARACTERISTIC_UUIDS:
-                                self._write_uuid = char_obj.uuid
-                            if char_obj.uuid in READ_CHARACTERISTIC_UUIDS:
-                                self._read_uuid = char_obj.uuid
-
-                    if not self._read_uuid or not self._write_uuid:
-                        LOGGER.error(f"No supported read/write UUIDs found for {self._mac}. Disconnecting.")
-                        await self.disconnect() # Call disconnect to clean up
-                        return False
-                    LOGGER.info(f"For {self._mac}: Read UUID={self._read_uuid}, Write UUID={self._write_uuid}")
-
+                LOGGER.info("Successfully connected to %s", self._mac)
                 await asyncio.sleep(0.1)
-                LOGGER.info(f"Starting notifications for {self._mac} on {self._read_uuid}")
-                await self._device.start_notify(self._read_uuid, self.notification_handler)
-                LOGGER.info(f"Notifications started for {self._mac}")
 
-                await self.triggerStatus() # Get initial status
-                await asyncio.sleep(0.1) # Allow status to be processed
-                return True
-            except BleakError as error:
-                track = traceback.format_exc()
-                LOGGER.error(f"BleakError connecting to {self._mac}: {error}")
-                LOGGER.error(f"BleakError traceback: {track}")
-            except Exception as inner_error:
-                track = traceback.format_exc()
-                LOGGER.error(f"Inner exception connecting to {self._mac}: {inner_error}")
-                LOGGER.error(f"Inner exception traceback: {track}")
-
-        except Exception as outer_error:
-            track = traceback.format_exc()
-            LOGGER.error(f"Outer exception in connect() for {self._mac}: {outer_error}")
-            LOGGER.error(f"Outer exception traceback: {track}")
+                self._write_char = None
+                self._read_char = None
+                # Look the known characteristics up directly instead of walking every service
+                services = self._device.services
+                for uuid in _WRITE_UUIDS:
+                    char_obj = services.get_characteristic(uuid)
+                    if char_obj:
+                        self._write_char = char_obj
+                        # Commands are confirmed via status notifications, so skip the ATT ack when possible
+                        self._write_needs_response = "write-without-response" not in char_obj.properties
+                        self._write_response_supported = "write" in char_obj.properties
+                        break
+                for uuid in _READ_UUIDS:
+                    char_obj = services.get_characteristic(uuid)
+                    if char_obj:
+                        self._read_char = char_obj
+                        break
+
+                if not self._read_char or not self._write_char:
+                    LOGGER.error("No supported read/write UUIDs found for %s. Disconnecting.", self._mac)
+                    await self.disconnect() # Call disconnect to clean up
+                    return False
+                LOGGER.info("For %s: Read UUID=%s, Write UUID=%s", self._mac, self._read_char.uuid, self._write_char.uuid)
+
+                # BlueZ reports the default 23 byte MTU until it has been acquired explicitly
+                acquire_mtu = getattr(getattr(self._device, "_backend", None), "_acquire_mtu", None)
+                if acquire_mtu:
+                    try:
+                        await acquire_mtu()
+                    except Exception as error:
+                        LOGGER.debug("Could not acquire MTU for %s: %s", self._mac, error)
+                self._write_payload = self._device.mtu_size - 3
+                LOGGER.debug("MTU for %s is %s", self._mac, self._device.mtu_size)
+            self._connected_flag = True
+
+            await asyncio.sleep(0.1)
+            LOGGER.info("Starting notifications for %s on %s", self._mac, self._read_char.uuid)
+            if self._notification_task is None or self._notification_task.done():
+                self._notification_task = asyncio.create_task(self._drain_notifications())
+            await self._device.start_notify(self._read_char, self._on_notification)
+            LOGGER.info("Notifications started for %s", self._mac)
+
+            await self.triggerStatus() # Get initial status
+            await self._wait_for_ack(2, 0.1) # Allow status to be processed
+            return True
+        # A briefly unreachable lamp is the common case here, keep the traceback for debug logging
+        except BleakError as error:
+            LOGGER.warning("BleakError connecting to %s: %s", self._mac, error, exc_info=LOGGER.isEnabledFor(logging.DEBUG))
+        except Exception as error:
+            LOGGER.error("Unexpected error connecting to %s: %s", self._mac, error, exc_info=LOGGER.isEnabledFor(logging.DEBUG))
 
         await self.disconnect() # Ensure disconnected on any error during connect
         return False
 
     async def update(self):
-        LOGGER.debug(f"Update called for {self._mac}")
+        LOGGER.debug("Update called for %s", self._mac)
         try:
             if not self._device or not self._device.is_connected:
-                LOGGER.info(f"Device {self._mac} not connected for update, attempting connect.")
+                LOGGER.info("Device %s not connected for update, attempting connect.", self._mac)
                 if not await self.connect():
-                    LOGGER.warning(f"Was not able to connect to device {self._mac} for updates.")
+                    LOGGER.warning("Was not able to connect to device %s for updates.", self._mac)
                     # await self.disconnect() # connect() already handles disconnect on failure
                     return
             
             # Assuming notifications are started by connect() if successful
             # If not, you might need:
-            # await self._device.start_notify(self._read_uuid, self.notification_handler)
+            # await self._device.start_notify(self._read_char, self._on_notification)
 
-            LOGGER.info(f"Triggering status request for {self._mac} during update.")
+            LOGGER.info("Triggering status request for %s during update.", self._mac)
             await self.triggerStatus()
         except Exception as error:
-            track = traceback.format_exc()
-            LOGGER.debug(f"Exception track for update {self._mac}: {track}")
-            LOGGER.error(f"Error during update for {self._mac}: {error}")
+            LOGGER.error("Error during update for %s: %s", self._mac, error, exc_info=LOGGER.isEnabledFor(logging.DEBUG))
             await self.disconnect()
 
     async def disconnect(self):
-        LOGGER.debug(f"Disconnecting from {self._mac}")
+        LOGGER.debug("Disconnecting from %s", self._mac)
+        if self._status_task and self._status_task is not asyncio.current_task():
+            self._status_task.cancel()
+            self._status_task = None
+        # Frames still waiting for the coalescing window would go nowhere, release their senders instead
+        if self._flush_task and self._flush_task is not asyncio.current_task():
+            self._flush_task.cancel()
+            self._flush_task = None
+        self._pending = []
+        self._pending_size = 0
+        self._flush_now.clear()
+        if self._flush_done:
+            if not self._flush_done.done():
+                self._flush_done.set_result(None)
+            self._flush_done = None
         if self._device and self._device.is_connected: # Check if self._device exists
             try:
-                if self._read_uuid: # Check if read_uuid was found
-                    await self._device.stop_notify(self._read_uuid)
-                    LOGGER.debug(f"Notifications stopped for {self._mac}")
+                if self._read_char: # Check if read characteristic was found
+                    await self._device.stop_notify(self._read_char)
+                    LOGGER.debug("Notifications stopped for %s", self._mac)
             except BleakError as e:
-                LOGGER.warning(f"BleakError stopping notifications for {self._mac}: {e}")
+                LOGGER.warning("BleakError stopping notifications for %s: %s", self._mac, e)
             except Exception as e: # Catch other potential errors
-                LOGGER.warning(f"Error stopping notifications for {self._mac}: {e}")
+                LOGGER.warning("Error stopping notifications for %s: %s", self._mac, e)
             
             await self._device.disconnect()
-            LOGGER.info(f"Disconnected from {self._mac}")
+            LOGGER.info("Disconnected from %s", self._mac)
         else:
-            LOGGER.debug(f"Device {self._mac} already disconnected or not initialized.")
-            
+            LOGGER.debug("Device %s already disconnected or not initialized.", self._mac)
+
+        # The drain task may be the caller here (shutdown notification), it is then left running for the next connect
+        if self._notification_task and self._notification_task is not asyncio.current_task():
+            self._notification_task.cancel()
+            self._notification_task = None
+        # Status queued before the disconnect must not flip the state back on
+        while not self._notification_queue.empty():
+            self._notification_queue.get_nowait()
+
+        self._connected_flag = False
         self._is_on = False
         self._light_on = False
         self._color_on = False
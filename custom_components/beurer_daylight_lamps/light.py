@@ -1,11 +1,13 @@
 import asyncio
+import time
 import voluptuous as vol
-from typing import Any, Optional, Tuple
+from typing import Any, Optional
 
 from custom_components.beurer_daylight_lamps.beurer_daylight_lamps import BeurerInstance
 from custom_components.beurer_daylight_lamps.const import DOMAIN
 
 from homeassistant.const import CONF_MAC
+from homeassistant.core import callback
 import homeassistant.helpers.config_validation as cv
 from homeassistant.components.light import (COLOR_MODE_RGB, PLATFORM_SCHEMA,
                                             LightEntity, ATTR_RGB_COLOR, ATTR_BRIGHTNESS, ATTR_EFFECT, COLOR_MODE_WHITE, ATTR_WHITE, LightEntityFeature)
@@ -17,8 +19,14 @@ PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend({
     vol.Required(CONF_MAC): cv.string
 })
 
+# Service arguments that decide which mode async_turn_on switches to
+_ATTR_SET = frozenset((ATTR_RGB_COLOR, ATTR_EFFECT, ATTR_BRIGHTNESS))
+
+# The setters only send the mode switch while their own channel is off, so a mode change clears that flag
+_INVALIDATE = {COLOR_MODE_WHITE: ("light_on",), COLOR_MODE_RGB: ("color_on",)}
+
 async def async_setup_entry(hass, config_entry, async_add_devices):
-    LOGGER.debug(f"Setting up device from lamp")
+    LOGGER.debug("Setting up device from lamp")
     instance = hass.data[DOMAIN][config_entry.entry_id]
     async_add_devices([BeurerLight(instance, config_entry.data["name"], config_entry.entry_id)])
 
@@ -27,23 +35,68 @@ class BeurerLight(LightEntity):
         self._instance = beurerInstance
         self._entry_id = entry_id
         self._attr_supported_color_modes = {COLOR_MODE_RGB, COLOR_MODE_WHITE}
-        self._color_mode = None
         self._attr_name = name
         self._attr_unique_id = self._instance.mac
+        # Static for the lifetime of the entity, set once instead of computed on every state write
+        self._attr_supported_features = LightEntityFeature.EFFECT
+        self._attr_effect_list = list(self._instance.supported_effects)
+        self._attr_device_info = {
+            "identifiers": {
+                (DOMAIN, self._instance.mac)
+            },
+            "name": name,
+            "connections": {(device_registry.CONNECTION_NETWORK_MAC, self._instance.mac)}
+        }
+        self._write_handle: asyncio.TimerHandle | None = None
+        self._last_push = 0.0
+        self._initial_update: asyncio.Task | None = None
+        self._rgb_source = None
+        self._rgb_cached = None
+        self._update_attrs()
 
     async def async_added_to_hass(self) -> None:
         """Add update callback after being added to hass."""
         self._instance.set_update_callback(self.update_callback)
-        await self._instance.update()
-
+        # Connect and fetch the initial state in the background, the status replies push it to the entity.
+        # A background task is not awaited by startup, so the BLE connect does not hold it up.
+        self._initial_update = self.hass.async_create_background_task(
+            self._instance.update(), name=f"beurer_daylight_lamps initial update {self._instance.mac}")
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Stop a connect that is still running and drop a pending state write."""
+        if self._initial_update and not self._initial_update.done():
+            self._initial_update.cancel()
+        self._initial_update = None
+        if self._write_handle:
+            self._write_handle.cancel()
+            self._write_handle = None
+
+    @callback
     def update_callback(self) -> None:
-        """Schedule a state update."""
-        #self.async_schedule_update_ha_state(False)
-        self.schedule_update_ha_state(False)
-
-    @property
-    def available(self):
-        return self._instance.is_on != None
+        """Schedule a state write, the instance calls this from the event loop."""
+        self._last_push = time.monotonic()
+        self._async_schedule_write()
+
+    @callback
+    def _async_schedule_write(self) -> None:
+        # The replies to one status request arrive back to back, write them as one state change
+        if self._write_handle is None:
+            self._write_handle = self.hass.loop.call_later(0.05, self._async_write_pending_state)
+
+    @callback
+    def _async_write_pending_state(self) -> None:
+        self._write_handle = None
+        self._update_attrs()
+        self.async_write_ha_state()
+
+    def _update_attrs(self) -> None:
+        """Copy the instance state into the _attr_* values Home Assistant reads."""
+        instance = self._instance
+        mode = instance.color_mode
+        self._attr_available = instance.is_on is not None
+        self._attr_is_on = instance.is_on
+        self._attr_color_mode = mode
+        self._attr_effect = "Off" if mode == COLOR_MODE_WHITE else instance.effect
 
     #We handle update triggers manually, do not poll
     @property
@@ -54,57 +107,27 @@ class BeurerLight(LightEntity):
     def brightness(self):
         if self._instance.color_mode == COLOR_MODE_WHITE:
             return self._instance.white_brightness
-        else:
-            return self._instance.color_brightness
-        return None
-
-    @property
-    def is_on(self) -> Optional[bool]:
-        return self._instance.is_on
+        return self._instance.color_brightness
 
     @property
     # RGB color/brightness based on https://github.com/home-assistant/core/issues/51175
     def rgb_color(self):
-        if self._instance.rgb_color:
-            return match_max_scale((255,), self._instance.rgb_color)
-        return None
-
-    @property
-    def effect(self):
-        if self._instance.color_mode == COLOR_MODE_WHITE:
-            return "Off"
-        else:
-            return self._instance.effect
-
-    @property
-    def effect_list(self):
-        return self._instance.supported_effects
-
-    @property
-    def supported_features(self):
-        return LightEntityFeature.EFFECT
-
-    @property
-    def color_mode(self):
-        return self._instance.color_mode
-
-    @property
-    def device_info(self):
-        return {
-            "identifiers": {
-                (DOMAIN, self._instance.mac)
-            },
-            "name": self.name,
-            "connections": {(device_registry.CONNECTION_NETWORK_MAC, self._instance.mac)}
-        }
-
-    def _transform_color_brightness(self, color: Tuple[int, int, int], set_brightness: int):
-        rgb = match_max_scale((255,), color)
-        res = tuple(int(color_val * set_brightness // 255) for color_val in rgb)
-        return res
+        # The instance replaces its color tuple on every change, so identity tells whether to rescale
+        rgb = self._instance.rgb_color
+        if rgb is not self._rgb_source:
+            self._rgb_source = rgb
+            self._rgb_cached = match_max_scale((255,), rgb) if rgb else None
+        return self._rgb_cached
 
     async def async_turn_on(self, **kwargs: Any) -> None:
-        LOGGER.debug(f"Turning lamp on with args: {kwargs}")
+        try:
+            await self._async_turn_on(**kwargs)
+        finally:
+            # Status replies only report differences from the state set here, so write it ourselves
+            self._async_schedule_write()
+
+    async def _async_turn_on(self, **kwargs: Any) -> None:
+        LOGGER.debug("Turning lamp on with args: %s", kwargs)
 
         # Handle the case where no arguments are provided - just turn on
         if len(kwargs) == 0:
@@ -115,61 +138,42 @@ class BeurerLight(LightEntity):
         current_mode = self._instance.color_mode
 
         # Determine target mode based on parameters
-        target_mode = None
-        if ATTR_RGB_COLOR in kwargs or ATTR_EFFECT in kwargs:
+        present = _ATTR_SET & kwargs.keys()
+        if ATTR_RGB_COLOR in present or ATTR_EFFECT in present:
             target_mode = COLOR_MODE_RGB
-        elif ATTR_BRIGHTNESS in kwargs and ATTR_RGB_COLOR not in kwargs and ATTR_EFFECT not in kwargs:
+        elif present:
             target_mode = COLOR_MODE_WHITE
+        else:
+            target_mode = None
 
-        # Force mode switch by updating internal state if needed
-        if target_mode and target_mode != current_mode:
-            LOGGER.debug(f"Mode switch required: {current_mode} -> {target_mode}")
-            # Update internal mode first
+        if target_mode:
             self._instance._mode = target_mode
-            # Reset relevant state flags
-            if target_mode == COLOR_MODE_WHITE:
-                self._instance._light_on = False
-                self._instance._color_on = False
-            else:
-                self._instance._light_on = False
-                self._instance._color_on = False
+
+        # Force mode switch by marking the target channel off, the setter then sends the switch and clears the other one
+        if target_mode and target_mode != current_mode:
+            LOGGER.debug("Mode switch required: %s -> %s", current_mode, target_mode)
+            self._instance.invalidate(*_INVALIDATE[target_mode])
 
         # Handle white mode using existing method but with forced mode
         if target_mode == COLOR_MODE_WHITE:
             brightness = kwargs[ATTR_BRIGHTNESS]
-            LOGGER.debug(f"Setting white mode with brightness {brightness}")
-            # Force the mode and use existing method
-            self._instance._mode = COLOR_MODE_WHITE
+            LOGGER.debug("Setting white mode with brightness %s", brightness)
             await self._instance.set_white(brightness)
             return
 
-        # Handle RGB/effect mode using existing methods
+        # Color, brightness and effect go out as one burst instead of separate writes with delays in between
         if target_mode == COLOR_MODE_RGB:
-            # Force the mode first
-            self._instance._mode = COLOR_MODE_RGB
-
-            # Set color first if provided
-            if ATTR_RGB_COLOR in kwargs:
-                color = kwargs[ATTR_RGB_COLOR]
-                LOGGER.debug(f"Setting RGB color {color}")
-                await self._instance.set_color(color)
-
-                # Then handle brightness if provided with color
-                if ATTR_BRIGHTNESS in kwargs:
-                    brightness = kwargs[ATTR_BRIGHTNESS]
-                    LOGGER.debug(f"Setting color brightness {brightness}")
-                    await asyncio.sleep(0.2)  # Small delay between operations
-                    await self._instance.set_color_brightness(brightness)
-
-            # Handle effect last
-            if ATTR_EFFECT in kwargs:
-                effect = kwargs[ATTR_EFFECT]
-                LOGGER.debug(f"Setting effect {effect}")
-                await asyncio.sleep(0.2)  # Small delay before effect
-                await self._instance.set_effect(effect)
+            await self._instance.set_color_brightness_effect(
+                kwargs.get(ATTR_RGB_COLOR), kwargs.get(ATTR_BRIGHTNESS), kwargs.get(ATTR_EFFECT))
 
     async def async_turn_off(self, **kwargs: Any) -> None:
-        await self._instance.turn_off()
+        try:
+            await self._instance.turn_off()
+        finally:
+            self._async_schedule_write()
 
     async def async_update(self) -> None:
-        await self._instance.update()
+        # A manual refresh right after the lamp pushed its state would only repeat the same status requests
+        if not self._instance.connected or time.monotonic() - self._last_push >= 5:
+            await self._instance.update()
+        self._update_attrs()